@@ -43,24 +43,204 @@ v1.0.0 - Initial release
 
 import csv
 import json
+import re
 import argparse
+from bisect import bisect_right
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
 import sys
 import os
-from PIL import Image, ImageDraw, ImageFont
+import PIL
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 import shutil
 from pathlib import Path
-import requests
-from packaging import version
-import urllib.request
-import tempfile
 
 __version__ = "1.4.0"
 __author__ = "Author: Joel Vazquez, WE0DX"
 __email__ = "joelvazquez@we0dx.us"
 __license__ = "MIT"
 
+# Accepted QSO date layouts: YYYY-MM-DD, MM/DD/YYYY or DD/MM/YYYY, YYYYMMDD
+_DATE_RE = re.compile(r'^(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})/(\d{1,2})/(\d{4})|(\d{4})(\d{2})(\d{2}))$')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Fixed start of the confirmation line on every card
+_CONFIRM_PREFIX = "QSL - Confirming "
+
+# Contact fields normalized to upper case when contacts are loaded
+_UPPER_FIELDS = ('call', 'mode', 'submode', 'pota_ref')
+
+# Upper bound on cached text masks per generator (see _draw_text)
+_TEXT_MASK_CACHE_SIZE = 4096
+
+# Cards between progress lines when generating without --verbose
+_PROGRESS_INTERVAL = 50
+
+def _normalize_contact(contact):
+    """Upper-case the identifier fields of a loaded (already stripped) contact in place"""
+    for key in _UPPER_FIELDS:
+        value = contact.get(key)
+        if value:
+            contact[key] = value.upper()
+
+def _format_date(date_str):
+    """Format an ISO, US/European or ADIF date as DD-Mon-YYYY"""
+    if not date_str:
+        return "?"
+    match = _DATE_RE.match(date_str)
+    if match:
+        iso_y, iso_m, iso_d, first, second, us_y, adif_y, adif_m, adif_d = match.groups()
+        if iso_y:
+            candidates = [(iso_y, iso_m, iso_d)]
+        elif us_y:
+            # Same precedence as before: MM/DD/YYYY first, then DD/MM/YYYY
+            candidates = [(us_y, first, second), (us_y, second, first)]
+        else:
+            candidates = [(adif_y, adif_m, adif_d)]
+        for year, month, day in candidates:
+            try:
+                parsed = datetime(int(year), int(month), int(day))
+            except ValueError:
+                continue
+            return f"{parsed.day:02d}-{_MONTHS[parsed.month - 1]}-{parsed.year:04d}"
+    return date_str[:10]
+
+def _format_time(time_str):
+    """Format a UTC time as HHMM"""
+    if not time_str:
+        return "?"
+    clean = time_str.replace(':', '').replace('.', '').strip()
+    return f"0{clean}" if len(clean) == 3 else clean[:4] if len(clean) >= 4 else time_str[:4]
+
+def _format_freq(freq_str):
+    """Format a frequency in MHz (kHz values are converted)"""
+    if not freq_str:
+        return "?"
+    try:
+        freq = float(freq_str)
+        return f"{freq/1000:.3f}" if freq > 1000 else f"{freq:.3f}"
+    except ValueError:
+        return freq_str[:8]
+
+# FreeType fonts shared by every generator in this process, keyed by (path, size)
+_FONT_CACHE = {}
+
+def _get_font(path, size):
+    """Load a TrueType font once per process"""
+    key = (path, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ImageFont.truetype(path, size)
+    return font
+
+# Generator copy used by card rendering worker processes
+_worker_generator = None
+
+def _init_worker(generator):
+    """Process pool initializer: keep one generator per worker process.
+    
+    Under the spawn start method the generator is unpickled here, which
+    loads its fonts into this worker's _FONT_CACHE; forked workers inherit
+    the parent's cache.
+    """
+    global _worker_generator
+    _worker_generator = generator
+
+def _render_card_task(task):
+    """Render and save one card inside a worker process"""
+    return _worker_generator.render_card_to_file(*task)
+
+def _read_json(path):
+    """Read a JSON configuration file (raises FileNotFoundError if missing)"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _write_json(path, data):
+    """Write a configuration dictionary as indented JSON.
+    
+    The file is written next to the target and renamed over it, so a
+    failed write never leaves a truncated config and hardlinked backups
+    (see _backup_file) keep the old contents.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        try:
+            shutil.copymode(path, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _backup_file(src, dst):
+    """Back up a file as a hardlink, copying where links are not supported.
+    
+    Only safe when the caller replaces the original right away (with
+    _write_json or os.replace); until then the backup shares its contents,
+    so an in-place edit of the original would change both. Use
+    shutil.copy2 for backups that may outlive an aborted update.
+    """
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copy2(src, dst)
+
+# HTTP session shared by the update check and release downloads
+_HTTP_SESSIONS = {}
+
+def _http_session(retry=True):
+    """Return a shared requests session, created on first use.
+    
+    Reusing one session keeps the connection to GitHub open between the
+    API call and the asset downloads. With retry, transient failures are
+    retried with a short backoff; the background check at startup passes
+    retry=False so an unreachable or rate-limited GitHub costs one timeout.
+    """
+    session = _HTTP_SESSIONS.get(retry)
+    if session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers['User-Agent'] = f"qsl-generator/{__version__}"
+        if retry:
+            # Retry-After can ask for minutes; the backoff keeps waits short
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                            respect_retry_after_header=False)
+            session.mount('https://', HTTPAdapter(max_retries=retries))
+        _HTTP_SESSIONS[retry] = session
+    return session
+
+def _download(url, target_path):
+    """Download a file and rename it over target_path"""
+    import tempfile
+    
+    target_dir = os.path.dirname(os.path.abspath(target_path))
+    with _http_session().get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, dir=target_dir) as tmp_file:
+            temp_path = tmp_file.name
+            try:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    tmp_file.write(chunk)
+            except BaseException:
+                tmp_file.close()
+                os.remove(temp_path)
+                raise
+    os.replace(temp_path, target_path)
+
 class QSLCardGenerator:
     
     def update_config_with_defaults(self, config_file):
@@ -71,14 +251,15 @@ class QSLCardGenerator:
         default_config = self.get_default_config()
         
         # Load existing config or create empty dict
-        existing_config = {}
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    existing_config = json.load(f)
-            except Exception as e:
-                print(f"Error reading existing config: {e}")
-                return False
+        config_exists = True
+        try:
+            existing_config = _read_json(config_file)
+        except FileNotFoundError:
+            existing_config = {}
+            config_exists = False
+        except Exception as e:
+            print(f"Error reading existing config: {e}")
+            return False
         
         # Find missing keys
         missing_keys = []
@@ -105,14 +286,13 @@ class QSLCardGenerator:
         
         try:
             # Create backup of existing config
-            if os.path.exists(config_file):
+            if config_exists:
                 backup_file = f"{config_file}.backup"
-                shutil.copy2(config_file, backup_file)
+                _backup_file(config_file, backup_file)
                 print(f"Backup created: {backup_file}")
             
             # Save updated config
-            with open(config_file, 'w') as f:
-                json.dump(updated_config, f, indent=2)
+            _write_json(config_file, updated_config)
             print(f"Configuration updated successfully: {config_file}")
             return True
             
@@ -131,8 +311,7 @@ class QSLCardGenerator:
         default_config = self.get_default_config()
         
         try:
-            with open(config_file, 'w') as f:
-                json.dump(default_config, f, indent=2)
+            _write_json(config_file, default_config)
             print(f"Default configuration created: {config_file}")
             return True
         except Exception as e:
@@ -141,23 +320,22 @@ class QSLCardGenerator:
 
     def reset_config_with_backup(self, config_file):
         """Save current config as backup and create new default config"""
-        if not os.path.exists(config_file):
-            print(f"Config file '{config_file}' does not exist. Creating default configuration.")
-            return self.create_default_config_file(config_file)
-        
         # Create backup filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = f"{config_file}.{timestamp}.old"
         
         try:
             # Create backup
-            shutil.copy2(config_file, backup_file)
+            try:
+                _backup_file(config_file, backup_file)
+            except FileNotFoundError:
+                print(f"Config file '{config_file}' does not exist. Creating default configuration.")
+                return self.create_default_config_file(config_file)
             print(f"Current configuration backed up to: {backup_file}")
             
             # Create new default config
             default_config = self.get_default_config()
-            with open(config_file, 'w') as f:
-                json.dump(default_config, f, indent=2)
+            _write_json(config_file, default_config)
             print(f"Default configuration recreated: {config_file}")
             return True
             
@@ -170,13 +348,20 @@ class QSLCardGenerator:
         return {
             "output": {
                 "default_directory": "qsl_cards",
-                "quality": 95
+                "format": "png",
+                "quality": 95,
+                "compress_level": 1,
+                "optimize": False,
+                "subsampling": 2,
+                "palette": False
             },
             "template": {
                 "default_image": "QSLTemplate.png"
             },
             "generation": {
-                "batch_by_call": True
+                "batch_by_call": True,
+                "jobs": 0,
+                "save_threads": 2
             },
             "card": {
                 "width": 1650,
@@ -368,6 +553,8 @@ class QSLCardGenerator:
                 "check_on_startup": True,
                 "auto_check_interval_days": 7,
                 "last_check_date": None,
+                "last_release_etag": None,
+                "latest_version": None,
                 "current_version": "1.3.0",
                 "update_script": True,
                 "update_config": True,
@@ -434,6 +621,18 @@ class QSLCardGenerator:
             if args.quality != config_quality:
                 changes['output.quality'] = args.quality
         
+        # Check PNG compression level (0 is a valid value)
+        if getattr(args, 'compress_level', None) is not None:
+            config_level = self.config.get('output', {}).get('compress_level', 1)
+            if args.compress_level != config_level:
+                changes['output.compress_level'] = args.compress_level
+        
+        # Check render process count (0 means all cores)
+        if getattr(args, 'jobs', None) is not None:
+            config_jobs = self.config.get('generation', {}).get('jobs', 0)
+            if args.jobs != config_jobs:
+                changes['generation.jobs'] = args.jobs
+        
         if changes:
             print(f"\nRuntime parameters differ from config file:")
             for key, value in changes.items():
@@ -466,10 +665,9 @@ class QSLCardGenerator:
         """Update config file with new values"""
         try:
             # Load current config or create new one
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            else:
+            try:
+                config = _read_json(config_file)
+            except FileNotFoundError:
                 config = {}
             
             # Apply changes using dot notation
@@ -483,8 +681,7 @@ class QSLCardGenerator:
                 current[keys[-1]] = value
             
             # Save updated config
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_json(config_file, config)
             print(f"Configuration updated and saved to {config_file}")
             
         except Exception as e:
@@ -492,13 +689,23 @@ class QSLCardGenerator:
 
     def check_and_clear_output_dir(self, output_dir):
         """Check if output directory has content and ask user if they want to clear it"""
-        if os.path.exists(output_dir) and os.listdir(output_dir):
+        # Only the first few names are shown, so stop scanning after them
+        files = []
+        more_files = False
+        if os.path.isdir(output_dir):
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if len(files) == 10:
+                        more_files = True
+                        break
+                    files.append(entry.name)
+        
+        if files:
             print(f"\nOutput directory '{output_dir}' contains files:")
-            files = os.listdir(output_dir)
-            for i, file in enumerate(files[:10]):  # Show first 10 files
+            for file in files:  # Show first 10 files
                 print(f"  - {file}")
-            if len(files) > 10:
-                print(f"  ... and {len(files) - 10} more files")
+            if more_files:
+                print("  ... and more files")
             
             ask_before_delete = self.config.get('output', {}).get('ask_before_delete', True)
             if not ask_before_delete:
@@ -552,22 +759,47 @@ class QSLCardGenerator:
                 except ValueError:
                     pass
         
+        # Only needed for network checks, so kept out of every startup
+        import requests
+        from packaging import version
+        
         try:
             print("Checking for updates..." if force_check else "Checking for updates (background)...")
             
             repo = update_config['github_repo']
             api_url = f"https://api.github.com/repos/{repo}/releases/latest"
             
-            # Make API request with timeout
-            response = requests.get(api_url, timeout=10)
+            # Background checks send the ETag of the last response; GitHub
+            # answers 304 without a body (or rate limit cost) if the latest
+            # release has not changed. Interactive checks need the full
+            # release data for the update prompt.
+            headers = {}
+            etag = update_config.get('last_release_etag')
+            cached_version = update_config.get('latest_version')
+            if not force_check and etag and cached_version:
+                headers['If-None-Match'] = etag
+            
+            # Make API request with timeout (background checks don't retry,
+            # so they never hold up startup for more than one timeout)
+            response = _http_session(retry=force_check).get(api_url, headers=headers, timeout=10)
+            current_version = update_config.get('current_version', __version__)
+            
+            if response.status_code == 304:
+                self.update_last_check_date()
+                if version.parse(cached_version) > version.parse(current_version):
+                    print(f"\n🎉 New version available: {cached_version} (current: {current_version})")
+                    print(f"Run with --check-updates to see update options")
+                    return True
+                return False
+            
             response.raise_for_status()
             
             release_data = response.json()
             latest_version = release_data['tag_name'].lstrip('v')
-            current_version = update_config.get('current_version', __version__)
             
             # Update last check date
-            self.update_last_check_date()
+            self.update_last_check_date(last_release_etag=response.headers.get('ETag'),
+                                        latest_version=latest_version)
             
             if version.parse(latest_version) > version.parse(current_version):
                 print(f"\n🎉 New version available!")
@@ -604,27 +836,28 @@ class QSLCardGenerator:
                 print(f"Unexpected error checking for updates: {e}")
             return False
 
-    def update_last_check_date(self):
-        """Update the last check date in config"""
+    def update_last_check_date(self, **release_info):
+        """Update the last check date (and any given release info) in config"""
         from datetime import datetime
         
         # Update in-memory config
         if 'update' not in self.config:
             self.config['update'] = {}
-        self.config['update']['last_check_date'] = datetime.now().isoformat()
+        changes = dict(release_info, last_check_date=datetime.now().isoformat())
+        self.config['update'].update(changes)
         
         # Save to file if config file exists
-        if hasattr(self, 'config_file') and self.config_file and os.path.exists(self.config_file):
+        if getattr(self, 'config_file', None):
             try:
-                with open(self.config_file, 'r') as f:
-                    file_config = json.load(f)
+                file_config = _read_json(self.config_file)
                 
                 if 'update' not in file_config:
                     file_config['update'] = {}
-                file_config['update']['last_check_date'] = self.config['update']['last_check_date']
+                file_config['update'].update(changes)
                 
-                with open(self.config_file, 'w') as f:
-                    json.dump(file_config, f, indent=2)
+                _write_json(self.config_file, file_config)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"Warning: Could not update last check date: {e}")
 
@@ -688,17 +921,9 @@ class QSLCardGenerator:
             
             print(f"Downloading {script_asset['name']}...")
             
-            # Download script
-            script_url = script_asset['browser_download_url']
+            # Download and replace current script
             current_script = __file__
-            
-            with tempfile.NamedTemporaryFile(mode='wb', delete=False) as tmp_file:
-                with urllib.request.urlopen(script_url) as response:
-                    shutil.copyfileobj(response, tmp_file)
-                temp_path = tmp_file.name
-            
-            # Replace current script
-            shutil.move(temp_path, current_script)
+            _download(script_asset['browser_download_url'], current_script)
             os.chmod(current_script, 0o755)
             
             print(f"✅ Script updated successfully!")
@@ -707,21 +932,16 @@ class QSLCardGenerator:
             if update_config and config_asset and update_config_obj.get('update_config', True):
                 print(f"Downloading {config_asset['name']}...")
                 
-                config_url = config_asset['browser_download_url']
-                config_file = getattr(self, 'config_file', 'qsl_config.json')
+                config_file = getattr(self, 'config_file', None) or 'qsl_config.json'
                 
-                # Create backup of current config
+                # Create backup of current config (a copy, since the
+                # download below can fail and leave the config in place)
                 if os.path.exists(config_file):
                     backup_config = f"{config_file}.backup"
                     shutil.copy2(config_file, backup_config)
                     print(f"Config backup created: {backup_config}")
                 
-                with tempfile.NamedTemporaryFile(mode='wb', delete=False) as tmp_file:
-                    with urllib.request.urlopen(config_url) as response:
-                        shutil.copyfileobj(response, tmp_file)
-                    temp_config_path = tmp_file.name
-                
-                shutil.move(temp_config_path, config_file)
+                _download(config_asset['browser_download_url'], config_file)
                 print(f"✅ Configuration updated successfully!")
             
             # Update version in config
@@ -742,14 +962,15 @@ class QSLCardGenerator:
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Backup script
+        # Copies rather than hardlinks: the update may stop before replacing
+        # these files, and the backups must not follow later in-place edits
         current_script = __file__
         backup_script = f"{current_script}.{timestamp}.backup"
         shutil.copy2(current_script, backup_script)
         print(f"Script backup created: {backup_script}")
         
         # Backup config if exists
-        config_file = getattr(self, 'config_file', 'qsl_config.json')
+        config_file = getattr(self, 'config_file', None) or 'qsl_config.json'
         if os.path.exists(config_file):
             backup_config = f"{config_file}.{timestamp}.backup"
             shutil.copy2(config_file, backup_config)
@@ -757,33 +978,37 @@ class QSLCardGenerator:
 
     def update_version_in_config(self, new_version):
         """Update the current version in config file"""
-        config_file = getattr(self, 'config_file', 'qsl_config.json')
-        
-        if not os.path.exists(config_file):
-            return
+        config_file = getattr(self, 'config_file', None) or 'qsl_config.json'
         
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = _read_json(config_file)
             
             if 'update' not in config:
                 config['update'] = {}
             
             config['update']['current_version'] = new_version
             
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_json(config_file, config)
                 
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Warning: Could not update version in config: {e}")
 
     def __init__(self, csv_file, template_image=None, config_file=None):
         self.csv_file = csv_file
+        self.config_file = config_file
         self.template_image = template_image
         self.contacts = []
+        # Logs repeat the same dates and frequencies many times, so each
+        # distinct raw value is only parsed once per run
+        self._date_cache = {}
+        self._freq_cache = {}
         
         # Load configuration FIRST
         self.config = self.load_config(config_file)
+        self._init_layout()
+        self._init_lookups()
         # Check for updates on startup (if enabled)
         if self.config.get('update', {}).get('check_on_startup', True):
             self.check_for_updates(force_check=False)
@@ -802,19 +1027,53 @@ class QSLCardGenerator:
         else:
             print("No template specified - using blank cards")
 
+        self._base_template = self._load_base_template()
+        self._table_chrome = {}
+        self._section_chrome = None
+        self._text_masks = {}
+        self._text_widths = {}
         self.load_fonts()
         self.load_contacts()
+        self._prepare_contacts()
+    
+    # Attributes sent to worker processes. Fonts and everything load_fonts()
+    # derives from them are left out: Pillow's fallback font is loaded from
+    # memory and can't be unpickled, so workers rebuild them in __setstate__.
+    _PICKLED_STATE = (
+        'csv_file', 'config_file', 'template_image', 'config',
+        '_date_cache', '_freq_cache', '_mode_cache', '_digital_cache',
+        '_layout', '_band_lo', '_band_hi', '_band_names', '_band_ranges',
+        '_digital_modes', '_digital_main', '_special_modes', '_colors',
+        '_confirm_border', '_confirm_color', '_max_contacts',
+        '_save_format', '_file_ext', '_save_options', '_save_palette',
+        '_base_template', '_table_chrome', '_section_chrome',
+    )
+    
+    def __getstate__(self):
+        """Pickle support for worker processes (fonts are reloaded on unpickle)"""
+        return {name: self.__dict__[name] for name in self._PICKLED_STATE}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Keyed by font object, so only valid in the process that built them
+        self._text_masks = {}
+        self._text_widths = {}
+        # Workers receive their contacts with each task
+        self.contacts = []
+        self.contacts_by_call = {}
+        self.load_fonts(warn=False)
     
     def load_config(self, config_file):
         """Load configuration from JSON file or create default"""
         default_config = self.get_default_config()
         
-        if config_file and os.path.exists(config_file):
+        if config_file:
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+                config = _read_json(config_file)
                 # Merge with defaults for missing keys
                 return self.merge_configs(default_config, config)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"Error loading config: {e}. Using defaults.")
         
@@ -837,13 +1096,12 @@ class QSLCardGenerator:
     def save_config(self, config, config_file):
         """Save configuration to file"""
         try:
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_json(config_file, config)
             print(f"Default configuration saved to {config_file}")
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
     
-    def load_fonts(self):
+    def load_fonts(self, warn=True):
         """Load fonts based on configuration"""
         font_config = self.config['fonts']
         sizes = font_config['sizes']
@@ -852,22 +1110,71 @@ class QSLCardGenerator:
         for size_name, size in sizes.items():
             try:
                 if size_name == 'bold':
-                    self.fonts[size_name] = ImageFont.truetype(font_config['bold'], size)
+                    self.fonts[size_name] = _get_font(font_config['bold'], size)
                 else:
-                    self.fonts[size_name] = ImageFont.truetype(font_config['primary'], size)
+                    self.fonts[size_name] = _get_font(font_config['primary'], size)
             except OSError:
                 self.fonts[size_name] = ImageFont.load_default()
         
-        if any(isinstance(font, type(ImageFont.load_default())) for font in self.fonts.values()):
+        if warn and any(isinstance(font, type(ImageFont.load_default())) for font in self.fonts.values()):
             print("Warning: Using default fonts")
+        
+        # Measure the fixed part of the confirmation text once
+        self._confirm_font = self.get_font_for_section('confirmation_text')
+        prefix_bbox = self._confirm_font.getbbox(_CONFIRM_PREFIX)
+        self._confirm_prefix_width = self._confirm_font.getlength(_CONFIRM_PREFIX)
+        self._confirm_text_height = prefix_bbox[3] - prefix_bbox[1]
+        
+        self._init_info_style()
+    
+    def _init_info_style(self):
+        """Resolve the additional info section's fonts, columns and line settings once"""
+        additional_cfg = self.config['additional_info']
+        section_fonts = additional_cfg.get('fonts', {})
+        columns = additional_cfg['columns']
+        colors = self._colors
+        fonts = self.fonts
+        layout = self._layout
+        section_x = layout.section_x
+        
+        col_comment = section_x + columns['comment_offset']
+        comment_max_width = additional_cfg.get('comment_max_width', None)
+        if not comment_max_width:
+            estimated_pota_width = 80
+            comment_max_width = layout.section_width - (col_comment - section_x) - estimated_pota_width - 30
+        
+        comment_font = fonts.get(section_fonts.get('comment', 'medium'), fonts['medium'])
+        sample_bbox = comment_font.getbbox("M")
+        
+        self._info_style = SimpleNamespace(
+            show_default_message=additional_cfg.get('show_default_message', False),
+            header_height=additional_cfg['header_height'],
+            min_row_height=additional_cfg.get('base_row_height', 22) + additional_cfg.get('row_spacing', 5),
+            col_date_band=section_x + columns['date_band_offset'],
+            col_comment=col_comment,
+            col_pota=section_x + columns['pota_offset'],
+            max_comment_width=comment_max_width,
+            date_band_font=fonts.get(section_fonts.get('date_band', 'medium'), fonts['medium']),
+            comment_font=comment_font,
+            comment_char_width=(sample_bbox[2] - sample_bbox[0]) or 8,
+            pota_font=fonts.get(section_fonts.get('pota', 'medium'), fonts['medium']),
+            default_message_font=fonts.get(section_fonts.get('default_message', 'large'), fonts['large']),
+            show_row_lines=additional_cfg.get('show_row_lines', True),
+            show_column_lines=additional_cfg.get('show_column_lines', False),
+            row_line_spacing=additional_cfg.get('row_line_spacing', 5),
+            line_color=colors.get('grid_lines', 'lightgray'),
+            line_width=additional_cfg.get('line_width', 1)
+        )
     
     def load_contacts(self):
         """Load and validate contacts from CSV"""
         try:
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
+            with open(self.csv_file, 'r', newline='', encoding='utf-8', buffering=1 << 20) as file:
+                reader = csv.reader(file)
+                # Normalize the header once instead of every key of every row
+                header = [h.strip().lower() for h in next(reader, [])]
                 for row in reader:
-                    contact = {k.strip().lower(): v.strip() for k, v in row.items() if v}
+                    contact = {k: v.strip() for k, v in zip(header, row) if v}
                     if contact.get('call'):
                         self.contacts.append(contact)
             print(f"Loaded {len(self.contacts)} contacts")
@@ -875,230 +1182,424 @@ class QSLCardGenerator:
             print(f"Error loading CSV: {e}")
             sys.exit(1)
     
+    def _prepare_contacts(self):
+        """Format, classify and group every contact once, right after loading"""
+        grouped = defaultdict(list)
+        for contact in self.contacts:
+            _normalize_contact(contact)
+            grouped[contact['call']].append(contact)
+            contact['_formatted'] = tuple(self.format_data(contact))
+            contact['_is_digital'] = self.is_digital_mode(contact.get('mode'), contact.get('submode'))
+            contact['_has_info'] = bool(contact.get('pota_ref') or contact.get('comment_intl'))
+        # Contacts per upper-case callsign, in log order
+        self.contacts_by_call = dict(grouped)
+    
     def format_data(self, contact):
         """Format contact data for display"""
-        def format_date(date_str):
-            if not date_str:
-                return "?"
-            for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y%m%d']:
-                try:
-                    return datetime.strptime(date_str, fmt).strftime('%d-%b-%Y')
-                except ValueError:
-                    continue
-            return date_str[:10]
-        
-        def format_time(time_str):
-            if not time_str:
-                return "?"
-            clean = time_str.replace(':', '').replace('.', '').strip()
-            return f"0{clean}" if len(clean) == 3 else clean[:4] if len(clean) >= 4 else time_str[:4]
-        
-        def format_freq(freq_str):
-            if not freq_str:
-                return "?"
-            try:
-                freq = float(freq_str)
-                return f"{freq/1000:.3f}" if freq > 1000 else f"{freq:.3f}"
-            except ValueError:
-                return freq_str[:8]
+        qso_date = contact.get('qso_date', '')
+        date_text = self._date_cache.get(qso_date)
+        if date_text is None:
+            date_text = self._date_cache[qso_date] = _format_date(qso_date)
         
-        def format_mode(mode, submode):
-            if not mode:
-                return "?"
-            mode, submode = mode.strip().upper(), (submode or "").strip().upper()
-            
-            # Handle special cases from config
-            special = self.config['modes']['special_handling']
-            if mode in special:
-                return special[mode]
-            if f"{mode}/{submode}" in special:
-                return special[f"{mode}/{submode}"]
-            
-            # Handle digital modes
-            if mode in self.config['modes']['digital_main']:
-                return submode if submode else mode
-            
-            return f"{mode}/{submode}"[:10] if submode and submode != mode else mode[:8]
+        freq = contact.get('freq', '')
+        freq_info = self._freq_cache.get(freq)
+        if freq_info is None:
+            freq_info = self._freq_cache[freq] = (_format_freq(freq), self._get_band(freq))
         
-        def get_band(freq_str):
-            if not freq_str:
-                return ""
-            try:
-                freq = float(freq_str) / 1000 if float(freq_str) > 1000 else float(freq_str)
-                for min_f, max_f, band in self.config['bands']:
-                    if min_f <= freq <= max_f:
-                        return band
-                return f"{freq:.0f}MHz"
-            except:
-                return ""
+        mode_key = (contact.get('mode', ''), contact.get('submode', ''))
+        mode_text = self._mode_cache.get(mode_key)
+        if mode_text is None:
+            mode_text = self._mode_cache[mode_key] = self._format_mode(*mode_key)
         
         return [
-            format_date(contact.get('qso_date', '')),
-            format_time(contact.get('time_on', '')),
-            format_freq(contact.get('freq', '')),
-            format_mode(contact.get('mode', ''), contact.get('submode', '')),
+            date_text,
+            _format_time(contact.get('time_on', '')),
+            freq_info[0],
+            mode_text,
             contact.get('rst_sent', '')[:4],
             contact.get('rst_rcvd', '')[:4],
-            contact.get('band', '') or get_band(contact.get('freq', '')),
+            contact.get('band', '') or freq_info[1],
             contact.get('comment_intl', '')[:26]
         ]
     
+    def _format_mode(self, mode, submode):
+        """Display form of a mode/submode pair, applying special_handling"""
+        if not mode:
+            return "?"
+        mode, submode = mode.strip().upper(), (submode or "").strip().upper()
+        
+        # Handle special cases from config
+        special = self._special_modes
+        if mode in special:
+            return special[mode]
+        if f"{mode}/{submode}" in special:
+            return special[f"{mode}/{submode}"]
+        
+        # Handle digital modes
+        if mode in self._digital_main:
+            return submode if submode else mode
+        
+        return f"{mode}/{submode}"[:10] if submode and submode != mode else mode[:8]
+    
+    def _get_band(self, freq_str):
+        """Band name for a frequency string, or the frequency in MHz if out of band"""
+        if not freq_str:
+            return ""
+        try:
+            freq = float(freq_str) / 1000 if float(freq_str) > 1000 else float(freq_str)
+            if self._band_ranges is not None:
+                for min_f, max_f, band in self._band_ranges:
+                    if min_f <= freq <= max_f:
+                        return band
+            else:
+                i = bisect_right(self._band_lo, freq) - 1
+                if i >= 0 and freq <= self._band_hi[i]:
+                    return self._band_names[i]
+            return f"{freq:.0f}MHz"
+        except (TypeError, ValueError):
+            return ""
+    
     def is_digital_mode(self, mode, submode):
         """Check if mode is digital based on configuration"""
-        mode = (mode or "").strip().upper()
-        submode = (submode or "").strip().upper()
+        key = (mode, submode)
+        result = self._digital_cache.get(key)
+        if result is None:
+            mode = (mode or "").strip().upper()
+            submode = (submode or "").strip().upper()
+            result = self._digital_cache[key] = (
+                mode in self._digital_modes or submode in self._digital_modes or 
+                mode in self._digital_main)
+        return result
+    
+    def _init_layout(self):
+        """Precompute the card geometry that does not depend on the contacts"""
+        config = self.config
+        table_cfg = config['table']
+        additional_cfg = config['additional_info']
         
-        digital_modes = self.config['modes']['digital']
-        digital_main = self.config['modes']['digital_main']
+        card_width = config['card']['width']
+        card_height = config['card']['height']
+        
+        table_x = table_cfg['x']
+        table_y = int(card_height * table_cfg['y_percent'])
+        table_width = card_width - table_cfg['width_margin']
+        table_height = int(card_height * table_cfg['height_percent'])
         
-        return (mode in digital_modes or submode in digital_modes or 
-                mode in digital_main)
+        col_widths = tuple(int(table_width * w) for w in config['columns']['widths_percent'])
+        col_xs = []
+        current_x = table_x
+        for width in col_widths:
+            col_xs.append(current_x)
+            current_x += width
+        
+        section_x = additional_cfg['x']
+        section_y = table_y + table_height + additional_cfg['y_offset'] - 25
+        section_width = card_width - additional_cfg['width_margin']
+        section_height = int(card_height * additional_cfg['height_percent'])
+        
+        pos_config = config.get('confirmation_text', {}).get('position', {})
+        
+        self._layout = SimpleNamespace(
+            card_width=card_width,
+            card_height=card_height,
+            table_x=table_x,
+            table_y=table_y,
+            table_width=table_width,
+            table_height=table_height,
+            col_widths=col_widths,
+            col_xs=tuple(col_xs),
+            # Rough truncation limit of 8 pixels per character
+            col_max_chars=tuple(max(1, w // 8) for w in col_widths),
+            section_x=section_x,
+            section_y=section_y,
+            section_width=section_width,
+            section_height=section_height,
+            show_confirmation=table_y > 100,
+            confirm_x=table_x + pos_config.get('x_offset', 10),
+            confirm_y=max(pos_config.get('min_y', 50), table_y + pos_config.get('y_offset', -40))
+        )
     
-    def create_base_image(self):
-        """Create base image from template or blank canvas"""
-        width = self.config['card']['width']
-        height = self.config['card']['height']
+    def _init_lookups(self):
+        """Build lookup tables derived from the configuration"""
+        # Band edges sorted by lower frequency for binary search in _get_band.
+        # That only matches the first configured band that contains a frequency
+        # when no two ranges overlap; otherwise _get_band scans them in order.
+        bands = sorted(self.config['bands'], key=lambda b: b[0])
+        self._band_lo = tuple(b[0] for b in bands)
+        self._band_hi = tuple(b[1] for b in bands)
+        self._band_names = tuple(b[2] for b in bands)
+        overlapping = any(lo <= hi for hi, lo in zip(self._band_hi, self._band_lo[1:]))
+        self._band_ranges = tuple(tuple(b) for b in self.config['bands']) if overlapping else None
+        
+        # Settings read on every card or row
+        # Modes are compared upper-case, so normalize the configured names once
+        modes = self.config['modes']
+        self._digital_modes = frozenset(m.upper() for m in modes['digital'])
+        self._digital_main = frozenset(m.upper() for m in modes['digital_main'])
+        self._special_modes = {k.upper(): v for k, v in modes['special_handling'].items()}
+        self._digital_cache = {}
+        self._mode_cache = {}
+        self._colors = self._parse_colors(self.config['colors'])
+        confirm_cfg = self.config.get('confirmation_text', {})
+        self._confirm_border = bool(confirm_cfg.get('show_border', False))
+        self._confirm_color = confirm_cfg.get('text_color', 'black')
+        self._max_contacts = self.config['table']['max_contacts']
+        self._init_save_options()
+    
+    def _init_save_options(self):
+        """Resolve the image encoder settings from the output config"""
+        # PNG ignores quality, JPEG ignores compress_level. optimize adds an
+        # extra encoding pass for smaller files in both formats.
+        output_cfg = self.config['output']
+        optimize = bool(output_cfg.get('optimize', False))
+        if str(output_cfg.get('format', 'png')).lower() in ('jpg', 'jpeg'):
+            self._save_format = 'JPEG'
+            self._file_ext = 'jpg'
+            self._save_options = {'quality': output_cfg.get('quality', 95),
+                                  'subsampling': output_cfg.get('subsampling', 2),
+                                  'optimize': optimize}
+        else:
+            self._save_format = 'PNG'
+            self._file_ext = 'png'
+            self._save_options = {'compress_level': output_cfg.get('compress_level', 1),
+                                  'optimize': optimize}
+        # 8-bit palette PNGs are a third of the pixel data to deflate; best for
+        # line-art or monochrome templates where 256 colors lose nothing visible
+        self._save_palette = self._save_format == 'PNG' and bool(output_cfg.get('palette', False))
+    
+    def set_output_options(self, **options):
+        """Override output settings (such as quality or compress_level) for this run"""
+        self.config['output'].update(options)
+        self._init_save_options()
+    
+    def _parse_colors(self, colors):
+        """Convert configured color names and hex codes to RGB tuples once.
+        
+        Pillow parses a color string on every draw call; tuples are used as-is.
+        Unparseable values are kept so they fail (or are ignored) where they
+        are used, as before.
+        """
+        parsed = {}
+        for name, value in colors.items():
+            try:
+                parsed[name] = ImageColor.getrgb(value)
+            except (ValueError, AttributeError):
+                parsed[name] = value
+        return parsed
+    
+    def _load_base_template(self):
+        """Open and resize the template (or create a blank canvas) once so every card can start from a copy"""
+        width = self._layout.card_width
+        height = self._layout.card_height
         
         if self.template_image and os.path.exists(self.template_image):
             try:
                 template = Image.open(self.template_image)
-                template = template.resize((width, height), Image.Resampling.LANCZOS)
+                template.load()
+                # Templates made at the card size are used as-is
+                if template.size != (width, height):
+                    template = template.resize((width, height), Image.Resampling.LANCZOS)
                 return template.convert('RGB') if template.mode != 'RGB' else template
             except Exception as e:
                 print(f"Template error: {e}. Using blank card.")
         
         return Image.new('RGB', (width, height), 'white')
     
-    def draw_contact_table(self, draw, contacts):
-        """Draw the main contact table"""
-        config = self.config
-        table_cfg = config['table']
-        colors = config['colors']
-        
-        # Calculate dimensions
-        card_width = config['card']['width']
-        card_height = config['card']['height']
+    def create_base_image(self):
+        """Create base image from template or blank canvas"""
+        return self._base_template.copy()
+    
+    def _get_table_chrome(self, rows):
+        """Return (row_height, image) for the static part of a table with the given row count.
         
-        table_x = table_cfg['x']
-        table_y = int(card_height * table_cfg['y_percent'])
-        table_width = card_width - table_cfg['width_margin']
-        table_height = int(card_height * table_cfg['height_percent'])
+        The header bar, header labels, row backgrounds and row outlines are the
+        same on every card with the same number of rows, so they are rendered
+        once and pasted onto each card.
+        """
+        cached = self._table_chrome.get(rows)
+        if cached is not None:
+            return cached
         
-        # Column setup
-        col_widths = [int(table_width * w) for w in config['columns']['widths_percent']]
-        headers = config['columns']['headers']
+        config = self.config
+        table_cfg = config['table']
+        colors = self._colors
+        layout = self._layout
         
-        # Row calculations
-        max_contacts = min(len(contacts), table_cfg['max_contacts'])
+        header_height = table_cfg['header_height']
         row_height = max(table_cfg['min_row_height'], 
-                        (table_height - table_cfg['header_height'] - 20) // (max_contacts + 1))
+                        (layout.table_height - header_height - 20) // (rows + 1))
         row_height = min(row_height, table_cfg['max_row_height'])
         
-        # Draw header
-        header_y = table_y
-        draw.rectangle([table_x, header_y, table_x + table_width, 
-                       header_y + table_cfg['header_height']], 
-                      fill=colors['header_bg'], outline='black', width=1)
-        
-        current_x = table_x
-        for i, header in enumerate(headers):
-            draw.text((current_x + 5, header_y + 6), header, 
-                fill=colors['header_text'], font=self.get_font_for_section('table_header'))
+        # Drawn with the table's top-left corner at (0, 0)
+        table_width = layout.table_width
+        chrome = Image.new('RGB', (table_width + 1, header_height + rows * row_height + 1), 'white')
+        draw = ImageDraw.Draw(chrome)
+        col_widths = layout.col_widths
+        col_xs = [x - layout.table_x for x in layout.col_xs]
+        
+        # Header
+        draw.rectangle([0, 0, table_width, header_height], fill=colors['header_bg'], outline='black', width=1)
+        header_font = self.get_font_for_section('table_header')
+        for i, header in enumerate(config['columns']['headers']):
+            current_x = col_xs[i]
+            draw.text((current_x + 5, 6), header, fill=colors['header_text'], font=header_font)
             if i < len(col_widths) - 1:
                 sep_x = current_x + col_widths[i]
-                draw.line([sep_x, header_y, sep_x, header_y + table_cfg['header_height']], 
-                         fill='white', width=1)
-            current_x += col_widths[i]
+                draw.line([sep_x, 0, sep_x, header_height], fill='white', width=1)
         
-        # Draw contact rows
-        for row_idx, contact in enumerate(contacts[:max_contacts]):
-            row_y = header_y + table_cfg['header_height'] + (row_idx * row_height)
-            
-            # Row background
+        # Row backgrounds
+        for row_idx in range(rows):
+            row_y = header_height + (row_idx * row_height)
             bg_color = 'white' if row_idx % 2 == 0 else colors['row_bg_alt']
-            draw.rectangle([table_x, row_y, table_x + table_width, row_y + row_height], 
+            draw.rectangle([0, row_y, table_width, row_y + row_height], 
                           fill=bg_color, outline='black', width=1)
-            
-            # Contact data
-            contact_data = self.format_data(contact)
-            current_x = table_x
-            
-            for i, data in enumerate(contact_data):
-                if i < len(col_widths):
-                    text_color = 'black'
-                    if i == 3 and self.is_digital_mode(contact.get('mode'), contact.get('submode')):
-                        text_color = colors['digital_mode']
-                    
-                    max_chars = max(1, col_widths[i] // 8)
-                    display_text = str(data)[:max_chars] if data else ''
-                    
-                    draw.text((current_x + 5, row_y + 6), display_text, 
-                        fill=text_color, font=self.get_font_for_section('table_data'))
-                    
-                    if i < len(col_widths) - 1:
-                        sep_x = current_x + col_widths[i]
-                        draw.line([sep_x, row_y, sep_x, row_y + row_height], 
-                                 fill='gray', width=1)
-                    current_x += col_widths[i]
-        
-        return header_y + table_cfg['header_height'] + (max_contacts * row_height) + 10
-    
-    def draw_additional_info_section(self, draw, contacts):
-        """Draw additional information section (POTA references and comments) with lines"""
-        config = self.config
-        additional_cfg = config['additional_info']
-        
-        # Check if we have any additional info or should show default message
-        has_additional_info = any(c.get('pota_ref') or c.get('comment_intl') for c in contacts)
-        show_default_message = additional_cfg.get('show_default_message', False)
         
-        if not has_additional_info and not show_default_message:
+        cached = self._table_chrome[rows] = (row_height, chrome)
+        return cached
+    
+    def _draw_text(self, image, xy, text, fill, font):
+        """Draw text by pasting a cached glyph mask.
+        
+        Table cells repeat the same short strings (modes, bands, reports) on
+        many cards. Rendering each string once and pasting it with the fill
+        color gives the same pixels as draw.text without re-running the
+        FreeType layout every time.
+        """
+        if not text:
             return
+        key = (font, text)
+        cached = self._text_masks.get(key)
+        if cached is None:
+            left, top, right, bottom = font.getbbox(text)
+            if right <= left or bottom <= top:
+                return
+            mask = Image.new('L', (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+            if len(self._text_masks) >= _TEXT_MASK_CACHE_SIZE:
+                self._text_masks.clear()
+            cached = self._text_masks[key] = (left, top, mask)
+        left, top, mask = cached
+        image.paste(fill, (xy[0] + left, xy[1] + top), mask)
+    
+    def _text_width(self, text, font):
+        """Width of the text's bounding box, cached for strings that repeat across cards"""
+        key = (font, text)
+        width = self._text_widths.get(key)
+        if width is None:
+            left, _, right, _ = font.getbbox(text)
+            width = right - left
+            if len(self._text_widths) >= _TEXT_MASK_CACHE_SIZE:
+                self._text_widths.clear()
+            self._text_widths[key] = width
+        return width
+    
+    def draw_contact_table(self, image, draw, contacts):
+        """Draw the main contact table"""
+        table_cfg = self.config['table']
+        colors = self._colors
+        layout = self._layout
+        
+        col_widths = layout.col_widths
+        col_xs = layout.col_xs
+        col_max_chars = layout.col_max_chars
+        header_y = layout.table_y
+        
+        # Static header and row backgrounds
+        max_contacts = min(len(contacts), self._max_contacts)
+        row_height, chrome = self._get_table_chrome(max_contacts)
+        image.paste(chrome, (layout.table_x, header_y))
+        
+        rows_top = header_y + table_cfg['header_height']
+        data_font = self.get_font_for_section('table_data')
+        digital_color = colors['digital_mode']
+        text_color_default = (0, 0, 0)
+        draw_text = self._draw_text
+        # Text x position and character limit of each column
+        cells = tuple(zip([x + 5 for x in col_xs], col_max_chars))
         
-        colors = config['colors']
-        
-        # Calculate section dimensions
-        card_width = config['card']['width']
-        card_height = config['card']['height']
-        table_y = int(card_height * config['table']['y_percent'])
-        table_height = int(card_height * config['table']['height_percent'])
-        section_x = additional_cfg['x']
-        section_y = table_y + table_height + additional_cfg['y_offset'] - 25
-        section_width = card_width - additional_cfg['width_margin']
-        section_height = int(card_height * additional_cfg['height_percent'])
-        table_header_height = additional_cfg['header_height']
-
-        # Draw section
-        draw.rectangle([section_x, section_y, section_x + section_width,
-                    section_y + section_height],
+        # Draw contact rows
+        for row_idx, contact in enumerate(contacts[:max_contacts]):
+            text_y = rows_top + (row_idx * row_height) + 6
+            is_digital = contact['_is_digital']
+            
+            # Contact data (formatted once at load time)
+            for i, ((text_x, max_chars), data) in enumerate(zip(cells, contact['_formatted'])):
+                text_color = digital_color if i == 3 and is_digital else text_color_default
+                draw_text(image, (text_x, text_y), data[:max_chars], text_color, data_font)
+        
+        # Column separators go on top of the cell text, spanning all rows
+        rows_bottom = rows_top + (max_contacts * row_height)
+        if max_contacts:
+            for i in range(len(col_widths) - 1):
+                sep_x = col_xs[i] + col_widths[i]
+                draw.line([sep_x, rows_top, sep_x, rows_bottom], fill='gray', width=1)
+        
+        return rows_bottom + 10
+    
+    def _get_section_chrome(self):
+        """Return the static background, header bar and title of the additional info section"""
+        if self._section_chrome is not None:
+            return self._section_chrome
+        
+        additional_cfg = self.config['additional_info']
+        colors = self._colors
+        layout = self._layout
+        section_width = layout.section_width
+        section_height = layout.section_height
+        
+        # Drawn with the section's top-left corner at (0, 0)
+        chrome = Image.new('RGB', (section_width + 1, section_height + 1), 'white')
+        draw = ImageDraw.Draw(chrome)
+        draw.rectangle([0, 0, section_width, section_height],
                     fill=colors['section_bg'], outline='black', width=1)
         
         # Header with background - USE CONFIGURABLE FONT
-        header_height = table_header_height
-        draw.rectangle([section_x, section_y, section_x + section_width,
-                    section_y + header_height],
+        draw.rectangle([0, 0, section_width, additional_cfg['header_height']],
                     fill=colors['header_bg'], outline='black', width=1)
         
         # Get header font from config
         header_font_size = additional_cfg.get('fonts', {}).get('header', 'bold')
         header_font = self.fonts.get(header_font_size, self.fonts['bold'])
         
-        draw.text((section_x + 10, section_y + 5), "Additional Information",
+        draw.text((10, 5), "Additional Information",
                 fill=colors['header_text'], font=header_font)
         
+        self._section_chrome = chrome
+        return chrome
+    
+    def draw_additional_info_section(self, image, draw, contacts):
+        """Draw additional information section (POTA references and comments) with lines"""
+        style = self._info_style
+        
+        # Contacts that have additional info (flagged once at load time)
+        contacts_with_info = [c for c in contacts[:self._max_contacts] if c['_has_info']]
+        show_default_message = style.show_default_message
+        
+        if not contacts_with_info and not show_default_message:
+            return
+        
+        colors = self._colors
+        
+        # Section dimensions are precomputed in _init_layout
+        layout = self._layout
+        section_x = layout.section_x
+        section_y = layout.section_y
+        section_width = layout.section_width
+        section_height = layout.section_height
+        header_height = style.header_height
+
+        # Static section background, header bar and title
+        image.paste(self._get_section_chrome(), (section_x, section_y))
+        
         # Calculate available space and row dimensions
         available_height = section_height - header_height - 20
-        max_contacts = self.config['table']['max_contacts']
-        
-        # Filter contacts that have additional info
-        contacts_with_info = [c for c in contacts[:max_contacts] 
-                            if c.get('pota_ref') or c.get('comment_intl')]
         
         # If no contacts have additional info but we want to show default message
         if not contacts_with_info and show_default_message:
             import random
             
             # Get random message from config
+            additional_cfg = self.config['additional_info']
             default_messages = additional_cfg.get('default_messages', ['Thanks for the contact(s)!'])
             if isinstance(default_messages, list) and len(default_messages) > 0:
                 default_message = random.choice(default_messages)
@@ -1110,9 +1611,7 @@ class QSLCardGenerator:
             content_height = section_height - header_height - 20
             message_y = content_y + (content_height // 2) - 10
             
-            # GET DEFAULT MESSAGE FONT FROM CONFIG
-            default_msg_font_size = additional_cfg.get('fonts', {}).get('default_message', 'large')
-            default_msg_font = self.fonts.get(default_msg_font_size, self.fonts['large'])
+            default_msg_font = style.default_message_font
             
             # Draw default message centered
             try:
@@ -1132,123 +1631,90 @@ class QSLCardGenerator:
             return
         
         # Calculate dynamic row height based on available space
-        base_row_height = additional_cfg.get('base_row_height', 22)
-        row_spacing = additional_cfg.get('row_spacing', 5)
-        total_row_height = base_row_height + row_spacing
-        info_row_height = max(total_row_height, min(35, available_height // len(contacts_with_info)))
-        
-        # Define column positions and widths from config
-        col_positions = {
-            'date_band': section_x + additional_cfg['columns']['date_band_offset'],
-            'comment': section_x + additional_cfg['columns']['comment_offset'],
-            'pota': section_x + additional_cfg['columns']['pota_offset']
-        }
-        
-        # Calculate maximum comment width
-        comment_max_width = additional_cfg.get('comment_max_width', None)
-        if comment_max_width:
-            max_comment_width = comment_max_width
-        else:
-            estimated_pota_width = 80
-            max_comment_width = section_width - (col_positions['comment'] - section_x) - estimated_pota_width - 30
+        info_row_height = max(style.min_row_height, min(35, available_height // len(contacts_with_info)))
         
-        # GET FONTS FROM CONFIG
-        date_band_font_size = additional_cfg.get('fonts', {}).get('date_band', 'medium')
-        comment_font_size = additional_cfg.get('fonts', {}).get('comment', 'medium')
-        pota_font_size = additional_cfg.get('fonts', {}).get('pota', 'medium')
+        # Column positions and fonts are resolved once in _init_info_style
+        col_date_band = style.col_date_band
+        col_comment = style.col_comment
+        col_pota = style.col_pota
+        date_band_font = style.date_band_font
+        comment_font = style.comment_font
+        pota_font = style.pota_font
         
-        date_band_font = self.fonts.get(date_band_font_size, self.fonts['medium'])
-        comment_font = self.fonts.get(comment_font_size, self.fonts['medium'])
-        pota_font = self.fonts.get(pota_font_size, self.fonts['medium'])
+        line_color = style.line_color
+        line_width = style.line_width
+        row_line_spacing = style.row_line_spacing if style.show_row_lines else None
         
-        # Get line configuration options
-        show_row_lines = additional_cfg.get('show_row_lines', True)
-        show_column_lines = additional_cfg.get('show_column_lines', False)
-        line_color = colors.get('grid_lines', 'lightgray')
-        line_width = additional_cfg.get('line_width', 1)
+        text_width = self._text_width
+        draw_text = self._draw_text
         
         # Draw column separator lines if enabled
-        if show_column_lines:
+        if style.show_column_lines:
             # Vertical line between date/band and comment columns
-            comment_line_x = col_positions['comment'] - 10
+            comment_line_x = col_comment - 10
             draw.line([comment_line_x, section_y + header_height, 
                     comment_line_x, section_y + section_height - 5],
                     fill=line_color, width=line_width)
             
             # Vertical line between comment and POTA columns (only if POTA column is used)
             if any(c.get('pota_ref') for c in contacts_with_info):
-                pota_line_x = col_positions['pota'] - 10  
+                pota_line_x = col_pota - 10  
                 draw.line([pota_line_x, section_y + header_height,
                         pota_line_x, section_y + section_height - 5],
                         fill=line_color, width=line_width)
         
+        # Comments longer than this are cut with an ellipsis
+        max_chars = max(10, style.max_comment_width // style.comment_char_width)
+        rows_bottom = section_y + section_height - 5
+        last_row = len(contacts_with_info) - 1
+        
         for row_idx, contact in enumerate(contacts_with_info):
             # Check if we have enough vertical space
             info_y = section_y + header_height + 10 + (row_idx * info_row_height)
-            if info_y + info_row_height > section_y + section_height - 5:
+            if info_y + info_row_height > rows_bottom:
                 break
             
             # Draw horizontal row separator line if enabled (after each row except the last)
-            if show_row_lines and row_idx < len(contacts_with_info) - 1:
-                line_spacing = additional_cfg.get('row_line_spacing', 5)
-                line_y = info_y + info_row_height - line_spacing
+            if row_line_spacing is not None and row_idx < last_row:
+                line_y = info_y + info_row_height - row_line_spacing
                 draw.line([section_x + 5, line_y, section_x + section_width - 5, line_y],
                         fill=line_color, width=line_width)
             
-            callsign = contact.get('call', '').upper()
-            pota_ref = contact.get('pota_ref', '').strip().upper()
+            pota_ref = contact.get('pota_ref', '')
             comment = contact.get('comment_intl', '')
             
             # Date and Band - USE CONFIGURABLE FONT
-            contact_data = self.format_data(contact)
+            contact_data = contact['_formatted']
             date_band = f"{contact_data[0]} {contact_data[6]}"
             
-            # Measure text width to ensure it fits
-            try:
-                date_band_bbox = draw.textbbox((0, 0), date_band, font=date_band_font)
-                date_band_width = date_band_bbox[2] - date_band_bbox[0]
-            except:
-                date_band_width = len(date_band) * 7
+            # Measure text width to ensure it fits (the same date and band
+            # repeat across rows and cards, so widths come from a cache)
+            date_band_width = text_width(date_band, date_band_font)
             
             # Truncate date/band if too long
-            if date_band_width > (col_positions['comment'] - col_positions['date_band'] - 10):
-                while date_band_width > (col_positions['comment'] - col_positions['date_band'] - 20) and len(date_band) > 5:
+            if date_band_width > (col_comment - col_date_band - 10):
+                while date_band_width > (col_comment - col_date_band - 20) and len(date_band) > 5:
                     date_band = date_band[:-4] + "..."
-                    try:
-                        date_band_bbox = draw.textbbox((0, 0), date_band, font=date_band_font)
-                        date_band_width = date_band_bbox[2] - date_band_bbox[0]
-                    except:
-                        date_band_width = len(date_band) * 7
+                    date_band_width = text_width(date_band, date_band_font)
             
-            draw.text((col_positions['date_band'], info_y), date_band,
-                    fill='black', font=date_band_font)
+            draw_text(image, (col_date_band, info_y), date_band, 'black', date_band_font)
             
             # Comment - USE CONFIGURABLE FONT
-            comment_end_x = col_positions['comment']
+            comment_end_x = col_comment
             if comment:
-                # Calculate maximum characters that fit in available space
-                try:
-                    sample_bbox = draw.textbbox((0, 0), "M", font=comment_font)
-                    char_width = sample_bbox[2] - sample_bbox[0]
-                except:
-                    char_width = 8
-                
-                max_chars = max(10, max_comment_width // char_width)
                 comment_text = comment[:max_chars-3] + "..." if len(comment) > max_chars else comment
                 
-                text_color = colors['digital_mode'] if self.is_digital_mode(
-                    contact.get('mode'), contact.get('submode')) else colors['comment']
+                text_color = colors['digital_mode'] if contact['_is_digital'] else colors['comment']
                 
-                draw.text((col_positions['comment'], info_y), comment_text,
+                # Comments are mostly unique, so they skip the mask cache
+                draw.text((col_comment, info_y), comment_text,
                         fill=text_color, font=comment_font)
                         
-                # Calculate actual end position of comment text
-                try:
-                    comment_bbox = draw.textbbox((0, 0), comment_text, font=comment_font)
-                    comment_width = comment_bbox[2] - comment_bbox[0]
-                    comment_end_x = col_positions['comment'] + comment_width + 15
-                except:
-                    comment_end_x = col_positions['comment'] + len(comment_text) * char_width + 15
+                # Calculate actual end position of comment text (only needed
+                # to place a POTA reference after it)
+                if pota_ref:
+                    comment_bbox = comment_font.getbbox(comment_text)
+                    comment_end_x = col_comment + comment_bbox[2] - comment_bbox[0] + 15
             
             # POTA Reference - USE CONFIGURABLE FONT
             if pota_ref:
@@ -1256,16 +1722,12 @@ class QSLCardGenerator:
                 
                 # Use dynamic positioning if comment exists, otherwise use configured position
                 if comment:
-                    pota_x = max(comment_end_x, col_positions['pota'])
+                    pota_x = max(comment_end_x, col_pota)
                 else:
-                    pota_x = col_positions['pota']
+                    pota_x = col_pota
                 
                 # Measure POTA text width
-                try:
-                    pota_bbox = draw.textbbox((0, 0), pota_text, font=pota_font)
-                    pota_width = pota_bbox[2] - pota_bbox[0]
-                except:
-                    pota_width = len(pota_text) * 7
+                pota_width = text_width(pota_text, pota_font)
                 
                 # Calculate available space for POTA
                 max_pota_width = section_width - (pota_x - section_x) - 20
@@ -1274,79 +1736,64 @@ class QSLCardGenerator:
                 if pota_width > max_pota_width:
                     while pota_width > max_pota_width - 20 and len(pota_text) > 8:
                         pota_text = pota_text[:-4] + "..."
-                        try:
-                            pota_bbox = draw.textbbox((0, 0), pota_text, font=pota_font)
-                            pota_width = pota_bbox[2] - pota_bbox[0]
-                        except:
-                            pota_width = len(pota_text) * 7
+                        pota_width = text_width(pota_text, pota_font)
                 
-                draw.text((pota_x, info_y), pota_text,
-                        fill=colors['pota_ref'], font=pota_font)
+                draw_text(image, (pota_x, info_y), pota_text, colors['pota_ref'], pota_font)
 
     
     def create_qsl_card(self, callsign, contacts, card_number=1, total_cards=1, total_contacts_for_callsign=None):
         """Create a single QSL card"""
-        contacts_for_card = contacts[:self.config['table']['max_contacts']]
+        contacts_for_card = contacts[:self._max_contacts]
         
         img = self.create_base_image()
         draw = ImageDraw.Draw(img)
         
         # Add confirmation text if space available
-        table_y = int(self.config['card']['height'] * self.config['table']['y_percent'])
-        if table_y > 100:
-            # Get positioning from config
-            pos_config = self.config.get('confirmation_text', {}).get('position', {})
-            x_offset = pos_config.get('x_offset', 10)
-            y_offset = pos_config.get('y_offset', -40)
-            min_y = pos_config.get('min_y', 50)
-            
-            confirm_y = max(min_y, table_y + y_offset)
-            text_x = self.config['table']['x'] + x_offset
+        layout = self._layout
+        if layout.show_confirmation:
+            confirm_y = layout.confirm_y
+            text_x = layout.confirm_x
             
             # Create confirmation text
             contact_count = len(contacts_for_card)
             total_qsos = total_contacts_for_callsign or contact_count
-            confirm_text = f"QSL - Confirming {total_qsos} QSO{'s' if total_qsos > 1 else ''} with {callsign.upper()}"
+            confirm_tail = f"{total_qsos} QSO{'s' if total_qsos > 1 else ''} with {callsign.upper()}"
             if total_cards > 1:
-                confirm_text += f" (Card {card_number} of {total_cards})"
+                confirm_tail += f" (Card {card_number} of {total_cards})"
+            confirm_text = _CONFIRM_PREFIX + confirm_tail
+            confirm_font = self._confirm_font
             
-            # Text background
-            bbox = draw.textbbox((0, 0), confirm_text, font=self.get_font_for_section('confirmation_text'))
-            text_width = bbox[2] - bbox[0]
-            
-            # Get text color from config
-            text_color = self.config.get('confirmation_text', {}).get('text_color', 'black')
-            
-            if self.config.get('confirmation_text', {}).get('show_border', False):
+            if self._confirm_border:
+                # Text background: only the variable tail needs measuring
+                text_width = self._confirm_prefix_width + confirm_font.getlength(confirm_tail)
                 draw.rectangle([text_x - 10, confirm_y - 5, text_x + text_width + 10,
-                            confirm_y + bbox[3] - bbox[1] + 5],
+                            confirm_y + self._confirm_text_height + 5],
                             fill='white', outline='black', width=1)
-            draw.text((text_x, confirm_y), confirm_text, fill=text_color, font=self.get_font_for_section('confirmation_text'))
+            draw.text((text_x, confirm_y), confirm_text, fill=self._confirm_color, font=confirm_font)
         
-        self.draw_contact_table(draw, contacts_for_card)
-        self.draw_additional_info_section(draw, contacts_for_card)
+        self.draw_contact_table(img, draw, contacts_for_card)
+        self.draw_additional_info_section(img, draw, contacts_for_card)
         
         return img
     
-    def generate_cards(self, output_dir, batch_by_call=False):
-        """Generate QSL cards"""
+    def generate_cards(self, output_dir, batch_by_call=False, verbose=False):
+        """Generate QSL cards, listing every card only when verbose"""
         if not self.check_and_clear_output_dir(output_dir):
             return 0
         os.makedirs(output_dir, exist_ok=True)
         cards_generated = 0
-        max_contacts = self.config['table']['max_contacts']
+        max_contacts = self._max_contacts
         
-        # Group contacts by callsign
-        grouped = defaultdict(list)
-        for contact in self.contacts:
-            callsign = contact.get('call', '').upper()
-            grouped[callsign].append(contact)
+        grouped = self.contacts_by_call
         
         print(f"Processing {len(grouped)} unique callsigns with {len(self.contacts)} total contacts")
         print(f"Max contacts per card: {max_contacts}")
         
+        ext = self._file_ext
+        tasks = []
         for callsign, contacts in grouped.items():
-            print(f"Processing {callsign} with {len(contacts)} contacts")
+            if verbose:
+                print(f"Processing {callsign} with {len(contacts)} contacts")
             
             # Split contacts into groups (max_contacts per card)
             contact_groups = []
@@ -1354,34 +1801,113 @@ class QSLCardGenerator:
                 contact_groups.append(contacts[i:i+max_contacts])
             
             total_cards_for_callsign = len(contact_groups)
-            print(f"  Will create {total_cards_for_callsign} cards for {callsign}")
+            if verbose:
+                print(f"  Will create {total_cards_for_callsign} cards for {callsign}")
             
-            # Create cards for this callsign
+            # Queue cards for this callsign
             for card_num, contact_group in enumerate(contact_groups, 1):
-                print(f"  Creating card {card_num} of {total_cards_for_callsign} for {callsign} ({len(contact_group)} contacts)")
-                
-                card = self.create_qsl_card(callsign, contact_group, card_num, total_cards_for_callsign, len(contacts))
+                if verbose:
+                    print(f"  Creating card {card_num} of {total_cards_for_callsign} for {callsign} ({len(contact_group)} contacts)")
                 
                 # Determine filename based on mode
                 if batch_by_call:
                     # Batch mode naming
                     if total_cards_for_callsign == 1:
-                        filename = f"{callsign}.png"
+                        filename = f"{callsign}.{ext}"
                     else:
-                        filename = f"{callsign}_card_{card_num}_of_{total_cards_for_callsign}.png"
+                        filename = f"{callsign}_card_{card_num}_of_{total_cards_for_callsign}.{ext}"
                 else:
                     # Individual mode naming
                     if total_cards_for_callsign == 1:
-                        filename = f"{callsign}.png"
+                        filename = f"{callsign}.{ext}"
                     else:
-                        filename = f"{callsign}_{card_num}_of_{total_cards_for_callsign}.png"
+                        filename = f"{callsign}_{card_num}_of_{total_cards_for_callsign}.{ext}"
                 
                 filepath = os.path.join(output_dir, filename)
-                card.save(filepath, 'PNG', quality=self.config['output']['quality'])
-                cards_generated += 1
-                print(f"  Saved: {filename}")
+                tasks.append((callsign, contact_group, card_num, total_cards_for_callsign,
+                              len(contacts), filepath))
+        
+        # A line per card floods the terminal on large logs, so only report
+        # progress periodically unless verbose output was requested
+        total_cards = len(tasks)
+        for filepath in self._render_tasks(tasks):
+            cards_generated += 1
+            if verbose:
+                print(f"  Saved: {os.path.basename(filepath)}")
+            elif cards_generated % _PROGRESS_INTERVAL == 0 or cards_generated == total_cards:
+                print(f"  Saved {cards_generated} of {total_cards} cards")
         
         return cards_generated
+    
+    def _render_tasks(self, tasks):
+        """Render and save the queued cards, yielding each file path in order"""
+        generation_cfg = self.config.get('generation', {})
+        jobs = generation_cfg.get('jobs', 0) or os.cpu_count() or 1
+        jobs = min(jobs, len(tasks))
+        
+        if jobs > 1:
+            # Cards are independent, so render them across processes. Small
+            # chunks keep workers evenly loaded when some cards are slower.
+            chunksize = max(1, min(8, len(tasks) // (jobs * 4)))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                yield from executor.map(_render_card_task, tasks, chunksize=chunksize)
+            return
+        
+        save_threads = generation_cfg.get('save_threads', 2)
+        if save_threads < 1 or len(tasks) < 2:
+            for task in tasks:
+                yield self.render_card_to_file(*task)
+            return
+        
+        # Pillow releases the GIL while encoding, so saving on background
+        # threads overlaps PNG compression with drawing the next card. The
+        # queue is bounded to keep only a few finished cards in memory.
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=save_threads) as saver:
+            for task in tasks:
+                card = self.create_qsl_card(*task[:5])
+                pending.append(saver.submit(self.save_card, card, task[5]))
+                if len(pending) > 2 * save_threads:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def render_card_to_file(self, callsign, contacts, card_number, total_cards,
+                            total_contacts_for_callsign, filepath):
+        """Create a single QSL card and save it, returning the file path"""
+        card = self.create_qsl_card(callsign, contacts, card_number, total_cards,
+                                    total_contacts_for_callsign)
+        return self.save_card(card, filepath)
+    
+    def save_card(self, card, filepath):
+        """Save a rendered card with the configured output format, returning the file path"""
+        if self._save_palette:
+            card = card.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        card.save(filepath, self._save_format, **self._save_options)
+        return filepath
+
+def _config_arg_defaults(config_file):
+    """Command line defaults taken from the config file, or the built-in config if it can't be read"""
+    defaults = QSLCardGenerator.__new__(QSLCardGenerator).get_default_config()
+    try:
+        config = _read_json(config_file)
+    except (OSError, ValueError):
+        config = {}
+    
+    # A malformed config is reported by load_config; fall back to the
+    # built-in value for anything that isn't where it should be
+    def config_value(section, key):
+        section_cfg = config.get(section) if isinstance(config, dict) else None
+        if isinstance(section_cfg, dict) and key in section_cfg:
+            return section_cfg[key]
+        return defaults[section][key]
+    
+    return {
+        'output_dir': config_value('output', 'default_directory'),
+        'template_image': config_value('template', 'default_image'),
+        'batch_by_call': config_value('generation', 'batch_by_call'),
+    }
 
 def main():
     parser = argparse.ArgumentParser(description='Generate QSL cards from ham radio contact CSV')
@@ -1417,6 +1943,14 @@ def main():
                        help='Card height in pixels (default: from config)')
     parser.add_argument('--quality', type=int, choices=range(1, 101), metavar='[1-100]',
                        help='Output image quality 1-100 (default: from config)')
+    parser.add_argument('--compress-level', type=int, choices=range(0, 10), metavar='[0-9]',
+                       help='PNG compression level 0-9 (default: from config)')
+    parser.add_argument('-j', '--jobs', type=int, metavar='N',
+                       help='Processes used to render cards, 0 for all cores (default: from config)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='List every callsign and card while generating')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Load and group the contacts, then exit without generating cards')
     parser.add_argument('--auto-delete', action='store_true', 
                        help='Automatically delete output directory contents without asking')
     parser.add_argument('--check-updates', action='store_true',
@@ -1428,11 +1962,23 @@ def main():
     
     args = parser.parse_args()
     
+    # Config values become the argument defaults, so anything given on the
+    # command line takes precedence without post-parse fallbacks. The first
+    # parse finds the config file with the full option syntax (e.g. -bc FILE);
+    # the info and config management commands never use the defaults.
+    if not (args.info or args.update_config or args.create_default_config
+            or args.reset_config):
+        parser.set_defaults(**_config_arg_defaults(args.config))
+        args = parser.parse_args()
+    
     if args.info:
         print(f"QSL Card Generator {__version__}")
         print(f"Author: {__author__}")
         print(f"Email: {__email__}")
         print(f"License: {__license__}")
+        # Pillow-SIMD publishes its releases as post-releases of Pillow's version
+        backend = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+        print(f"Imaging: {backend} {PIL.__version__}")
         return
     
     # Handle configuration management operations
@@ -1457,42 +2003,53 @@ def main():
     if not args.csv_file:
         parser.error("CSV file is required for QSL card generation")
     
-    generator = QSLCardGenerator(args.csv_file, args.template_image, args.config)
-    
-    # Rest of the existing main() function logic continues unchanged...
-    # Use config defaults if no command line args specified
-    if not args.output_dir:
-        args.output_dir = generator.config.get('output', {}).get('default_directory', 'qsl_cards')
-    
-    if not args.template_image:
-        args.template_image = generator.config.get('template', {}).get('default_image')
-    
-    if not args.batch_by_call:
-        args.batch_by_call = generator.config.get('generation', {}).get('batch_by_call', False)
+    if args.jobs is not None and args.jobs < 0:
+        parser.error("--jobs must be 0 (all cores) or a positive number")
     
     if args.sample:
+        # Only the CSV is needed, so skip the config, fonts, template and update check
+        generator = QSLCardGenerator.__new__(QSLCardGenerator)
+        generator.csv_file = args.csv_file
+        generator.contacts = []
+        generator.load_contacts()
         print("Sample contacts:")
         for i, contact in enumerate(generator.contacts[:3]):
+            _normalize_contact(contact)
             print(f"Contact {i+1}: {contact}")
         return
-
+    
+    generator = QSLCardGenerator(args.csv_file, args.template_image, args.config)
+    
     # Check if runtime args differ from config and offer to save
-    generator.check_and_save_runtime_config(args, args.config)
+    if not args.dry_run:
+        generator.check_and_save_runtime_config(args, args.config)
+    
+    # The process count is read when rendering starts, so it applies to this run
+    if args.jobs is not None:
+        generator.config.setdefault('generation', {})['jobs'] = args.jobs
+    
+    # Encoder settings are resolved at startup, so refresh them for this run
+    output_options = {key: value for key, value in (('quality', args.quality),
+                                                     ('compress_level', args.compress_level))
+                      if value is not None}
+    if output_options:
+        generator.set_output_options(**output_options)
     
     print(f"Generating cards with template: {args.template_image or 'None'}")
     
     # At the end of main(), before calling generate_cards:
     print(f"Total contacts: {len(generator.contacts)}")
-    grouped = defaultdict(list)
-    for contact in generator.contacts:
-        callsign = contact.get('call', '').upper()
-        grouped[callsign].append(contact)
+    grouped = generator.contacts_by_call
 
     print(f"Unique callsigns: {len(grouped)}")
-    for callsign, contacts in grouped.items():
-        print(f"  {callsign}: {len(contacts)} contacts")
+    if args.verbose and grouped:
+        print("\n".join(f"  {callsign}: {len(contacts)} contacts"
+                        for callsign, contacts in grouped.items()))
+    
+    if args.dry_run:
+        return
 
-    cards_generated = generator.generate_cards(args.output_dir, args.batch_by_call)
+    cards_generated = generator.generate_cards(args.output_dir, args.batch_by_call, args.verbose)
     mode = "batched" if args.batch_by_call else "individual"
     print(f"Generated {cards_generated} {mode} QSL cards in {args.output_dir}")
 
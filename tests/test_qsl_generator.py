@@ -0,0 +1,142 @@
+import json
+import pickle
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import qsl_generator  # noqa: E402
+from qsl_generator import QSLCardGenerator  # noqa: E402
+
+CSV_TEXT = """call,qso_date,time_on,freq,mode,submode,rst_sent,rst_rcvd,comment_intl,pota_ref
+W1ABC,2024-05-15,1430,14.074,MFSK,FT8,+03,-10,Great signal!,K-1234
+VE2XYZ,2024-05-15,1445,21.200,SSB,,59,59,,
+"""
+
+
+class GeneratorTestCase(unittest.TestCase):
+    """Builds generators from a throwaway CSV and config without network access"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.csv_file = self.tmp / 'contacts.csv'
+        self.csv_file.write_text(CSV_TEXT, encoding='utf-8')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def make_generator(self, **overrides):
+        """Create a generator, with each override as a {section: {key: value}} config patch"""
+        config = {'update': {'check_on_startup': False},
+                  'template': {'default_image': None}}
+        for section, values in overrides.items():
+            config.setdefault(section, {}).update(values)
+        config_file = self.tmp / 'qsl_config.json'
+        config_file.write_text(json.dumps(config), encoding='utf-8')
+        self.config_file = config_file
+        return QSLCardGenerator(str(self.csv_file), None, str(config_file))
+
+    def run_main(self, *args):
+        """Run the command line entry point, declining to save runtime settings"""
+        argv = ['qsl_generator.py', str(self.csv_file), '-c', str(self.config_file), *args]
+        with mock.patch.object(sys, 'argv', argv), \
+                mock.patch('builtins.input', return_value='n'):
+            qsl_generator.main()
+
+
+def png_zlib_level(path):
+    """Compression level hint (FLEVEL, 0-3) from the zlib header of a PNG's first IDAT chunk"""
+    data = Path(path).read_bytes()
+    pos = 8
+    while pos < len(data):
+        length, chunk_type = struct.unpack('>I4s', data[pos:pos + 8])
+        if chunk_type == b'IDAT':
+            return data[pos + 9] >> 6
+        pos += length + 12
+    raise AssertionError(f"No IDAT chunk in {path}")
+
+
+class PickleTests(GeneratorTestCase):
+
+    def test_pickles_with_fallback_fonts(self):
+        generator = self.make_generator(fonts={'primary': str(self.tmp / 'missing.ttf'),
+                                               'bold': str(self.tmp / 'missing-bold.ttf')})
+        state = generator.__getstate__()
+        for name in ('fonts', '_confirm_font', '_info_style'):
+            self.assertNotIn(name, state)
+
+        worker = pickle.loads(pickle.dumps(generator))
+        self.assertEqual(worker.fonts.keys(), generator.fonts.keys())
+        self.assertIsNotNone(worker._info_style)
+        contacts = generator.contacts_by_call['W1ABC']
+        card = worker.create_qsl_card('W1ABC', contacts)
+        self.assertEqual(card.tobytes(), generator.create_qsl_card('W1ABC', contacts).tobytes())
+
+
+class BandTests(GeneratorTestCase):
+
+    def test_default_bands(self):
+        generator = self.make_generator()
+        self.assertIsNone(generator._band_ranges)
+        self.assertEqual(generator._get_band('14.074'), '20m')
+        self.assertEqual(generator._get_band('14074'), '20m')
+        self.assertEqual(generator._get_band('not a number'), '')
+
+    def test_overlapping_bands_use_first_match(self):
+        generator = self.make_generator()
+        generator.config['bands'] = [[1, 10, 'A'], [3, 4, 'B'], [20, 30, 'C']]
+        generator._init_lookups()
+        self.assertEqual(generator._get_band('5'), 'A')
+        self.assertEqual(generator._get_band('3.5'), 'A')
+        self.assertEqual(generator._get_band('25'), 'C')
+        self.assertEqual(generator._get_band('15'), '15MHz')
+
+
+class CommandLineTests(GeneratorTestCase):
+
+    def test_compress_level_applies_to_current_run(self):
+        self.make_generator(output={'compress_level': 1})
+        output_dir = self.tmp / 'cards'
+        self.run_main('-d', str(output_dir), '--compress-level', '9', '--jobs', '1')
+
+        # zlib records levels 7-9 as FLEVEL 3 and levels 0-1 as FLEVEL 0
+        self.assertEqual(png_zlib_level(output_dir / 'W1ABC.png'), 3)
+        saved = json.loads(self.config_file.read_text(encoding='utf-8'))
+        self.assertEqual(saved['output']['compress_level'], 1)
+
+    def test_combined_short_options_read_config_defaults(self):
+        output_dir = self.tmp / 'from_cfg'
+        self.make_generator(output={'default_directory': str(output_dir)},
+                            generation={'batch_by_call': False, 'jobs': 1})
+        argv = ['qsl_generator.py', str(self.csv_file), '-bc', str(self.config_file)]
+        with mock.patch.object(sys, 'argv', argv), \
+                mock.patch('builtins.input', return_value='y'):
+            qsl_generator.main()
+
+        self.assertTrue((output_dir / 'W1ABC.png').exists())
+        saved = json.loads(self.config_file.read_text(encoding='utf-8'))
+        self.assertEqual(saved['output']['default_directory'], str(output_dir))
+        self.assertIsNone(saved['template']['default_image'])
+        self.assertTrue(saved['generation']['batch_by_call'])
+
+    def test_config_defaults_tolerate_malformed_config(self):
+        config_file = self.tmp / 'broken.json'
+        config_file.write_text('[1, 2, 3]', encoding='utf-8')
+        defaults = qsl_generator._config_arg_defaults(str(config_file))
+        self.assertEqual(defaults['output_dir'], 'qsl_cards')
+
+        config_file.write_text(json.dumps({'output': 'cards', 'template': {'default_image': None},
+                                           'generation': {'batch_by_call': False}}),
+                               encoding='utf-8')
+        defaults = qsl_generator._config_arg_defaults(str(config_file))
+        self.assertEqual(defaults, {'output_dir': 'qsl_cards', 'template_image': None,
+                                    'batch_by_call': False})
+
+
+if __name__ == '__main__':
+    unittest.main()